@@ -6,19 +6,36 @@ Usage:
   python docs/docs_build.py build     # Build site into ./docs
   python docs/docs_build.py serve     # Build and serve ./docs at http://localhost:8000
   python docs/docs_build.py serve -p 5173
+
+Set CHANGEFORGE_FAST_MARKDOWN=1 to render Markdown with cmarkgfm (if installed).
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import http.server
+import json
+import mmap
 import os
 import re
 import shutil
 import socketserver
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
+
+# Optional C Markdown renderer (cmark-gfm), opt-in while it is rolled out
+_CMARK = None
+if os.environ.get("CHANGEFORGE_FAST_MARKDOWN") == "1":
+    try:
+        import cmarkgfm
+
+        _CMARK = cmarkgfm.github_flavored_markdown_to_html
+    except ImportError:
+        pass
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = REPO_ROOT / "docs" / "webpage"
@@ -26,6 +43,43 @@ TEMPLATES_DIR = SRC_DIR / "templates"
 CONTENT_DIR = SRC_DIR / "content"
 DEST_DIR = REPO_ROOT / "docs"
 IMG_DIR = REPO_ROOT / "docs" / "img"
+# Build state lives outside DEST_DIR so it never ends up in the published site
+MANIFEST_PATH = REPO_ROOT / ".docs_build_cache.json"
+
+
+@functools.lru_cache(maxsize=None)
+def _re(pattern: str | bytes, flags: int = 0) -> re.Pattern:
+    """Compile a pattern on first use, then reuse it for the whole process."""
+    return re.compile(pattern, flags)
+
+
+# Patterns only some pages/builds need; compiled lazily through _re().
+# Pages are transformed as UTF-8 bytes, so these are bytes patterns.
+_BADGE_PATTERN = (
+    rb'(<span\s+class="badge"\s*>\s*)v?[0-9]+\.[0-9]+\.[0-9]+(\s*</span>)'
+)
+# Relative stylesheet links and image sources, rewritten when a CNAME is set
+_BASEURL_PATTERN = (
+    rb'href="(?:\./|\.\./)styles\.css"|src="(?:\./|\.\./)img/(?P<img>[^"]+)"'
+)
+
+# Placeholders filled by render_with_base
+_TEMPLATE_SLOT_PATTERN = r"\{\{(TITLE|CONTENT|REL|VERSION)\}\}"
+
+# Precompiled patterns, shared by every page of the build
+_INLINE_CODE_RE = re.compile(r"`([^`]+)`")
+_MD_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_PYPROJECT_VERSION_BYTES_RE = re.compile(rb'(?mi)^\s*version\s*=\s*"(.*?)"\s*$')
+
+# Markdown block markers as (prefix, prefix length, tag). They all end with
+# a space, so a line's marker is everything up to its first space.
+_BLOCK_PREFIXES = (
+    ("### ", 4, "h3"),
+    ("## ", 3, "h2"),
+    ("# ", 2, "h1"),
+    ("- ", 2, "li"),
+)
+_BLOCK_MARKERS = {prefix: (n, tag) for prefix, n, tag in _BLOCK_PREFIXES}
 
 
 def read_version_from_pyproject(pyproject_path: Path) -> str:
@@ -33,14 +87,17 @@ def read_version_from_pyproject(pyproject_path: Path) -> str:
     Read version="x.y.z" from pyproject.toml without third-party deps.
     Returns a normalized string like "v1.2.3" (with leading 'v').
     """
-    if not pyproject_path.exists():
+    if not pyproject_path.exists() or pyproject_path.stat().st_size == 0:
         return "v0.0.0"
-    content = pyproject_path.read_text(encoding="utf-8")
-    # Try common patterns under [project] or tool sections
-    m = re.search(r'(?mi)^\s*version\s*=\s*"(.*?)"\s*$', content)
-    if not m:
-        return "v0.0.0"
-    ver = m.group(1).strip()
+    # Search the mapped bytes directly, no read + decode of the whole file
+    with open(pyproject_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        # Try common patterns under [project] or tool sections
+        m = _PYPROJECT_VERSION_BYTES_RE.search(mm)
+        if not m:
+            return "v0.0.0"
+        ver = m.group(1).decode("utf-8").strip()
     if not ver.startswith("v"):
         ver = f"v{ver}"
     return ver
@@ -54,77 +111,138 @@ def ensure_dirs():
 def copy_images():
     # Images are already under docs/img → ensure they remain available
     # If user adds new images, just keep the folder as-is.
-    # We copy only if missing, to avoid unnecessary churn.
+    # We link (or copy) only if missing, to avoid unnecessary churn.
     src_img = REPO_ROOT / "docs" / "img"
-    if src_img.exists():
-        # Mirror copy while preserving existing files
-        for p in src_img.rglob("*"):
-            if p.is_file():
-                rel = p.relative_to(src_img)
-                dest = IMG_DIR / rel
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                if not dest.exists():
-                    shutil.copy2(p, dest)
-
-
-@dataclass
+    if not src_img.exists():
+        return
+    # Mirror via hardlinks while preserving existing files
+    stack = [str(src_img)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for e in entries:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                    continue
+                if not e.is_file(follow_symlinks=False):
+                    continue
+                dest = IMG_DIR / os.path.relpath(e.path, src_img)
+                os.makedirs(dest.parent, exist_ok=True)
+                try:
+                    os.link(e.path, dest)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    # Cross-device or no hardlink support → plain copy
+                    shutil.copy2(e.path, dest)
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_re(keys: Tuple[bytes, ...]) -> re.Pattern:
+    """Compile an alternation matching any of the given literal strings."""
+    # Longest first, so "../../img/" wins over its "../img/" suffix sibling
+    ordered = sorted(keys, key=len, reverse=True)
+    return re.compile(b"|".join(re.escape(k) for k in ordered))
+
+
+@dataclass(frozen=True)
 class TransformContext:
     version: str
     is_commands_page: bool
     is_root_page: bool
 
 
-def transform_html(
-    html: str, ctx: TransformContext, base_url: str | None = None
-) -> str:
-    """Apply small transforms: set version badge, fix asset paths."""
-    # 1) Replace version placeholders
-    html = html.replace("{{VERSION}}", ctx.version)
-    html = html.replace("{{REL}}", ".." if ctx.is_commands_page else ".")
-    # Also support replacing existing badge text
-    # <span class="badge">v0.1.4</span> → <span class="badge">vX.Y.Z</span>
-    html = re.sub(
-        r'(<span\s+class="badge"\s*>\s*)v?[0-9]+\.[0-9]+\.[0-9]+(\s*</span>)',
-        rf"\1{ctx.version}\2",
-        html,
-        flags=re.IGNORECASE,
+@functools.lru_cache(maxsize=None)
+def _context(version: str, is_commands_page: bool) -> TransformContext:
+    """Shared context for every page of the same version and kind."""
+    return TransformContext(
+        version=version,
+        is_commands_page=is_commands_page,
+        is_root_page=not is_commands_page,
     )
 
+
+@functools.lru_cache(maxsize=None)
+def _replacement_table(ctx: TransformContext) -> dict[bytes, bytes]:
+    """Literal replacements for a page kind. Cached, so don't mutate it."""
+    # 1) Replace version placeholders
+    table = {
+        b"{{VERSION}}": ctx.version.encode("utf-8"),
+        b"{{REL}}": b".." if ctx.is_commands_page else b".",
+    }
     # 2) Fix logo/image paths relative to destination
     # Root pages end up at docs/*.html → images live at docs/img/*
     # Command pages end up at docs/commands/*.html → images live at ../img/*
     if ctx.is_root_page:
         # from ../img/* → ./img/*
-        html = html.replace('src="../img/', 'src="./img/')
+        table[b'src="../img/'] = b'src="./img/'
         # sometimes authors may use ../../img in root src, normalize too
-        html = html.replace('src="../../img/', 'src="./img/')
+        table[b'src="../../img/'] = b'src="./img/'
     elif ctx.is_commands_page:
         # from ../../img/* → ../img/*
-        html = html.replace('src="../../img/', 'src="../img/')
+        table[b'src="../../img/'] = b'src="../img/'
+    return table
+
+
+def _transform_with_table(
+    html: bytes, table: dict[bytes, bytes], version: bytes, base_url: str | None
+) -> bytes:
+    # A plain substring check lets pages skip the literal pass when no
+    # table key can match: every key is a {{...}} placeholder or starts
+    # with src="../ (the table is case-sensitive, so this check is exact)
+    if b"{{" in html or b'src="../' in html:
+        # All literal replacements are applied in a single scan of the page
+        html = _literal_re(tuple(table)).sub(lambda m: table[m.group(0)], html)
+    # Also support replacing existing badge text
+    # <span class="badge">v0.1.4</span> → <span class="badge">vX.Y.Z</span>
+    html = _re(_BADGE_PATTERN, re.IGNORECASE).sub(
+        lambda m: m.group(1) + version + m.group(2), html
+    )
 
     # 3) If a base_url (from CNAME) is provided, convert asset paths to absolute URLs
     if base_url:
         # Normalize trailing slash
-        base = base_url.rstrip("/")
-        # Stylesheet link
-        html = re.sub(
-            r'href="(?:\./|\.\./)styles\.css"',
-            f'href="{base}/styles.css"',
-            html,
-            flags=re.IGNORECASE,
-        )
-        # Image sources (logo, screenshots, etc.)
-        html = re.sub(
-            r'src="(?:\./|\.\./)img/([^"]+)"',
-            rf'src="{base}/img/\1"',
-            html,
-            flags=re.IGNORECASE,
-        )
+        base = base_url.rstrip("/").encode("utf-8")
+
+        def absolute(m: re.Match) -> bytes:
+            # Image sources (logo, screenshots, etc.) or the stylesheet link
+            if m["img"] is not None:
+                return b'src="' + base + b"/img/" + m["img"] + b'"'
+            return b'href="' + base + b'/styles.css"'
+
+        # Both rewrites share a single scan of the page
+        html = _re(_BASEURL_PATTERN, re.IGNORECASE).sub(absolute, html)
 
     return html
 
 
+def transform_html(
+    html: bytes, ctx: TransformContext, base_url: str | None = None
+) -> bytes:
+    """
+    Apply small transforms: set version badge, fix asset paths.
+    Works on the UTF-8 encoded page, so pages are never decoded for it.
+    """
+    version = ctx.version.encode("utf-8")
+    return _transform_with_table(html, _replacement_table(ctx), version, base_url)
+
+
 def markdown_to_html(md: str) -> str:
+    """
+    Convert markdown to HTML, through cmark-gfm when enabled and available,
+    otherwise through the built-in converter.
+    """
+    if _CMARK is None:
+        return _markdown_to_html_py(md)
+    html = _CMARK(md)
+    # Give code blocks the same card shell the built-in converter uses
+    if "<pre" in html:
+        html = html.replace("<pre", '<div class="card code"><pre').replace(
+            "</pre>", "</pre></div>"
+        )
+    return html
+
+
+def _markdown_to_html_py(md: str) -> str:
     """
     Minimal markdown to HTML converter (headings, paragraphs, lists, code blocks, inline code).
     Not exhaustive, just enough for our docs.
@@ -164,30 +282,25 @@ def markdown_to_html(md: str) -> str:
         if in_code_block:
             code_buffer.append(line)
             continue
-        if line.startswith("### "):
-            flush_list()
-            html_lines.append(f"<h3>{line[4:].strip()}</h3>")
-            continue
-        if line.startswith("## "):
-            flush_list()
-            html_lines.append(f"<h2>{line[3:].strip()}</h2>")
-            continue
-        if line.startswith("# "):
-            flush_list()
-            html_lines.append(f"<h1>{line[2:].strip()}</h1>")
-            continue
-        if line.startswith("- "):
-            if not in_list:
-                in_list = True
-                html_lines.append("<ul>")
-            html_lines.append(f"<li>{line[2:].strip()}</li>")
+        block = _BLOCK_MARKERS.get(line[: line.find(" ", 0, 4) + 1])
+        if block is not None:
+            n, tag = block
+            # strip() hands back the slice itself when there is nothing to trim
+            body = line[n:].strip()
+            if tag == "li":
+                if not in_list:
+                    in_list = True
+                    html_lines.append("<ul>")
+            else:
+                flush_list()
+            html_lines.append(f"<{tag}>{body}</{tag}>")
             continue
         if not line.strip():
             flush_list()
             html_lines.append("")
             continue
         # inline code
-        text = re.sub(r"`([^`]+)`", r"<code>\1</code>", line)
+        text = _INLINE_CODE_RE.sub(r"<code>\1</code>", line)
         html_lines.append(f"<p>{text}</p>")
 
     flush_code()
@@ -196,28 +309,44 @@ def markdown_to_html(md: str) -> str:
     return "\n".join(html_lines).replace("\n\n\n", "\n\n")
 
 
+@functools.lru_cache(maxsize=4)
+def _load_template(path: Path, mtime_ns: int) -> str:
+    """Read a template once per (path, mtime); edits invalidate the entry."""
+    return path.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=4)
+def _template_parts(base_html: str) -> Tuple[str, ...]:
+    """Split a template into literal text and {{SLOT}} names, once per template."""
+    return tuple(_re(_TEMPLATE_SLOT_PATTERN).split(base_html))
+
+
 def render_with_base(
     content_html: str,
     page_title: str,
     is_commands_page: bool,
     version: str,
     base_url: str | None,
-) -> str:
-    base = (TEMPLATES_DIR / "base.html").read_text(encoding="utf-8")
-    rel = ".." if is_commands_page else "."
-    out = (
-        base.replace("{{TITLE}}", page_title)
-        .replace("{{CONTENT}}", content_html)
-        .replace("{{REL}}", rel)
-        .replace("{{VERSION}}", version)
-    )
-    # Final pass through transform to normalize any remaining bits
-    ctx = TransformContext(
-        version=version,
-        is_commands_page=is_commands_page,
-        is_root_page=not is_commands_page,
+    base_html: str | None = None,
+) -> bytes:
+    """Fill the base template for a page; returns the UTF-8 encoded HTML."""
+    if base_html is None:
+        path = TEMPLATES_DIR / "base.html"
+        base_html = _load_template(path, os.stat(path).st_mtime_ns)
+    values = {
+        "TITLE": page_title,
+        "CONTENT": content_html,
+        "REL": ".." if is_commands_page else ".",
+        "VERSION": version,
+    }
+    # Literals sit at even indexes and slot names at odd ones
+    parts = _template_parts(base_html)
+    out = "".join(values[p] if i % 2 else p for i, p in enumerate(parts))
+    # Final pass through transform to normalize any remaining bits.
+    # The page is encoded once here; everything downstream works on bytes.
+    return transform_html(
+        out.encode("utf-8"), _context(version, is_commands_page), base_url
     )
-    return transform_html(out, ctx, base_url)
 
 
 def read_cname_base_url(cname_path: Path) -> str | None:
@@ -232,6 +361,145 @@ def read_cname_base_url(cname_path: Path) -> str | None:
     return f"https://{domain}"
 
 
+def _stat_key(path: Path | str, st: os.stat_result | None = None) -> list:
+    """Cheap change fingerprint for a file: [mtime_ns, size]."""
+    if st is None:
+        st = os.stat(path, follow_symlinks=False)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _iter_markdown(root: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for every .md file under root, via os.scandir."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for e in entries:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(".md") and e.is_file():
+                    yield e.path, e.stat()
+
+
+def _load_manifest() -> dict:
+    """
+    Load the incremental build manifest
+    (src path → build key, output hash and output stat).
+    A missing or unreadable manifest, or one written by a different version
+    of this script, simply means everything gets rebuilt.
+    """
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("builder") != _stat_key(Path(__file__)):
+        return {}
+    return data.get("pages", {})
+
+
+def _save_manifest(pages: dict):
+    data = {"builder": _stat_key(Path(__file__)), "pages": pages}
+    MANIFEST_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _read_bytes_direct(path: str | Path) -> bytes:
+    """Read a whole file straight from its fd (no BufferedReader)."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+        # Short reads are allowed, keep going until EOF
+        while chunk := os.read(fd, 1 << 16):
+            data += chunk
+    finally:
+        os.close(fd)
+    return data
+
+
+def _read_text_direct(path: str | Path) -> str:
+    return _read_bytes_direct(path).decode("utf-8")
+
+
+def _write_bytes_direct(path: str | Path, data: bytes):
+    """Write a whole file with raw os.write calls (no BufferedWriter)."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _output_stat(dest: str) -> list | None:
+    """Fingerprint of a written output, or None when it is missing."""
+    try:
+        return _stat_key(dest)
+    except FileNotFoundError:
+        return None
+
+
+def _extract_title(md: str) -> str:
+    """Page title: the first "# " heading of the markdown, if present."""
+    # Titles sit at the top, so walk the lines starting with "#" there
+    # before scanning the whole page. The first "#" + whitespace line is
+    # the one the regex would pick; only the plain "# Title" form is taken
+    # here, anything else (tabs, empty titles, ...) goes to the regex.
+    i = 0 if md.startswith("#") else md.find("\n#", 0, 4096) + 1
+    while i >= 0 and md.startswith("#", i):
+        nxt = md[i + 1 : i + 2]
+        if nxt == " ":
+            end = md.find("\n", i)
+            title = (md[i + 2 : end] if end >= 0 else md[i + 2 :]).strip()
+            if title:
+                return title
+            break
+        if not nxt or nxt.isspace():
+            break
+        # "##..." and the like are not titles, try the next "#" line
+        j = md.find("\n#", i, 4096)
+        i = j + 1 if j >= 0 else -1
+    mtitle = _MD_TITLE_RE.search(md)
+    return mtitle.group(1).strip() if mtitle else "ChangeForge Docs"
+
+
+def _render_one(
+    job: tuple,
+    version: str,
+    base_url: str | None,
+    manifest: dict,
+    base_html: str | None = None,
+) -> Tuple[int, int, dict]:
+    """Render one build job. Returns (copied, transformed, manifest entry)."""
+    src, dest, is_commands, kind, key = job
+    entry = manifest.get(src)
+    # Up to date when the inputs match and dest is untouched since we wrote
+    # it; an edited (or deleted) output has a different stat and is rebuilt
+    out_stat = _output_stat(dest)
+    if entry and entry["key"] == key and entry["out"] == out_stat:
+        return 0, 0, entry
+    if kind == "markdown":
+        md = _read_text_direct(src)
+        html_body = markdown_to_html(md)
+        # Use the first heading as page title if present
+        data = render_with_base(
+            html_body, _extract_title(md), is_commands, version, base_url, base_html
+        )
+    else:
+        # Static pages go from disk to disk as bytes, never decoded
+        raw = _read_bytes_direct(src)
+        data = transform_html(raw, _context(version, is_commands), base_url)
+    digest = hashlib.sha1(data).hexdigest()
+    # Output identical to the untouched previous one → skip the write
+    if not (entry and entry["sha1"] == digest and entry["out"] == out_stat):
+        _write_bytes_direct(dest, data)
+        out_stat = _stat_key(dest)
+    return (0 if kind == "markdown" else 1), 1, {
+        "key": key,
+        "sha1": digest,
+        "out": out_stat,
+    }
+
+
 def build() -> Tuple[int, int]:
     """Build pages from docs/webpage → docs with path adjustments."""
     ensure_dirs()
@@ -239,27 +507,38 @@ def build() -> Tuple[int, int]:
     version = read_version_from_pyproject(REPO_ROOT / "pyproject.toml")
     base_url = read_cname_base_url(DEST_DIR / "CNAME")
 
-    copied = 0
-    transformed = 0
+    # Skip pages whose source, template and build inputs are unchanged
+    manifest = _load_manifest()
+
+    # Jobs are (src, dest, is_commands, kind, manifest key) tuples, with
+    # plain str paths so the per-page work stays clear of pathlib
+    jobs: list[tuple] = []
+    dest_root = str(DEST_DIR)
 
     # 0) Render content-driven pages (Markdown → HTML via template)
-    content_outputs: list[Tuple[Path, Path]] = []
+    content_dests: set[str] = set()
+    base_html = None
     if CONTENT_DIR.exists():
-        for src in CONTENT_DIR.rglob("*.md"):
-            rel = src.relative_to(CONTENT_DIR)
-            dest = DEST_DIR / rel.with_suffix(".html")
+        template_path = TEMPLATES_DIR / "base.html"
+        template_key = _stat_key(template_path)
+        # Shared by every markdown page, so load it once
+        base_html = _load_template(template_path, template_key[0])
+        content_root = str(CONTENT_DIR)
+        for src, st in _iter_markdown(content_root):
+            # scandir paths are always "<content_root><sep><rel>"
+            rel = src[len(content_root) + 1 :]
+            dest = os.path.join(dest_root, rel[:-3] + ".html")
             # Detect if under commands
-            is_commands = "commands" in rel.parts
-            md = src.read_text(encoding="utf-8")
-            html_body = markdown_to_html(md)
-            # Use the first heading as page title if present
-            mtitle = re.search(r"^#\s+(.+)$", md, flags=re.MULTILINE)
-            title = mtitle.group(1).strip() if mtitle else "ChangeForge Docs"
-            out = render_with_base(html_body, title, is_commands, version, base_url)
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(out, encoding="utf-8")
-            transformed += 1
-            content_outputs.append((src, dest))
+            is_commands = "commands" in rel.split(os.sep)
+            key = [
+                *_stat_key(src, st),
+                *template_key,
+                version,
+                base_url,
+                _CMARK is not None,
+            ]
+            jobs.append((src, dest, is_commands, "markdown", key))
+            content_dests.add(dest)
 
     # 1) Map static source → destination (skip those already generated)
     mappings = [
@@ -276,29 +555,52 @@ def build() -> Tuple[int, int]:
     for src, dest in mappings:
         if not src.exists():
             continue
-        # skip if this file was already generated from content
-        if dest.exists() and any(d == dest for _, d in content_outputs):
+        src, dest = str(src), str(dest)
+        # skip if this file is generated from content
+        if dest in content_dests:
             continue
-        raw = src.read_text(encoding="utf-8")
-        ctx = TransformContext(
-            version=version,
-            is_commands_page=("commands" in src.parts),
-            is_root_page=("commands" not in src.parts),
-        )
-        out = transform_html(raw, ctx, base_url)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text(out, encoding="utf-8")
-        copied += 1
-        transformed += 1
+        key = [*_stat_key(src), version, base_url]
+        is_commands = "commands" in src.split(os.sep)
+        jobs.append((src, dest, is_commands, "static", key))
+
+    # Create output folders up front so workers never race on mkdir
+    for parent in {os.path.dirname(dest) for _, dest, *_ in jobs}:
+        os.makedirs(parent, exist_ok=True)
+
+    # Pages are independent, so render them concurrently
+    render = functools.partial(
+        _render_one,
+        version=version,
+        base_url=base_url,
+        manifest=manifest,
+        base_html=base_html,
+    )
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(render, jobs))
 
+    copied = sum(r[0] for r in results)
+    transformed = sum(r[1] for r in results)
+    pages = {job[0]: r[2] for job, r in zip(jobs, results)}
+    _save_manifest(pages)
     return copied, transformed
 
 
+class _FastHandler(http.server.SimpleHTTPRequestHandler):
+    """Static handler without per-request logging and with a 256 KiB copy buffer."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def copyfile(self, source, outputfile):
+        shutil.copyfileobj(source, outputfile, length=1 << 18)
+
+
 def serve(port: int = 8000):
     copied, transformed = build()
     os.chdir(DEST_DIR)
-    handler = http.server.SimpleHTTPRequestHandler
-    with socketserver.TCPServer(("", port), handler) as httpd:
+    with socketserver.ThreadingTCPServer(("", port), _FastHandler) as httpd:
+        # Don't let lingering connections block shutdown
+        httpd.daemon_threads = True
         print(f"[docs] Built {copied} files (transformed {transformed}).")
         print(f"[docs] Serving docs directory at http://localhost:{port}")
         try: